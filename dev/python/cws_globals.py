@@ -53,8 +53,11 @@ class Screen(Protocol):
     def line(self, x1: int, y1: int, x2: int, y2: int, c: int,
              style: str = "") -> None: ...
     def put_image(self, x: int, y: int, sprite: list) -> None: ...
-    def get_image(self, x1: int, y1: int, x2: int, y2: int) -> list: ...
+    def get_image(self, x1: int, y1: int, x2: int, y2: int,
+                  into=None) -> list: ...
     def cls(self) -> None: ...
+    def watch(self, rects: list) -> None: ...
+    overdrawn: bool
 
 
 def _arr(size: int, default=0) -> list:
@@ -213,6 +216,14 @@ class GameState:
     online_client: object = None   # OnlineClient instance when in online mode
     event_log: list = field(default_factory=list)  # captured events for online replay
 
+    # ── Runtime handles and caches (Python port only, never saved) ──────
+    history_fp: object = None      # open cws.his handle while history is on
+    _mxw_cache: tuple = None       # (menu items, width) from the last mxw()
+    _flag_images: dict = field(default_factory=dict)  # {side: captured flags() image}
+    _topbar_sig: tuple = None      # topbar() inputs as last drawn
+    _menu_images: dict = field(default_factory=dict)  # {menu contents: captured box}
+    _anima: object = None          # army icon captured by animate()
+
     # ── Side helpers ───────────────────────────────────────────────────────
     def viewing_side(self) -> int:
         """Which side the local human player is controlling right now.
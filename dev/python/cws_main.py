@@ -318,10 +318,12 @@ def _title_menu(g: 'GameState') -> str:
 def _start_new_game(g: 'GameState') -> None:
     """Start new game: init history if enabled, draw map (L124-133)."""
     from cws_map import usa
+    from cws_ui import close_history
 
     s = g.screen
     if g.history == 1:                                      # L124
         s.cls()                                             # L125
+        close_history(g)
         try:
             his_path = save_path_write("cws.his")
             # L126: backup old history — skip shell command
@@ -461,6 +463,7 @@ def _end_round(g: 'GameState') -> str:
     g.rflag = 0                                             # L235
     g.mflag = 0
     g.nflag = 0
+    g._topbar_sig = None                                    # repaint topbar next turn
 
     if g.player == 3:                                       # Online mode
         return "online_wait"
@@ -947,7 +947,7 @@ def maptext(g: 'GameState') -> None:
             glyph = get_draw_glyph(code, rgb)
             if glyph is not None:
                 # Blit so the glyph origin (DRAW_OX, DRAW_OY) lands at (a, cy+12)
-                g.screen.surface.blit(glyph, (a - DRAW_OX, cy + 12 - DRAW_OY))
+                g.screen.put_image(a - DRAW_OX, cy + 12 - DRAW_OY, glyph)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -35,18 +35,36 @@ def save_dir() -> str:
     return _SAVE_DIR
 
 
+_data_names = None   # {NAME.UPPER(): real name} for _DATA_DIR, read once
+
+
+def _data_casemap() -> dict:
+    """Return the upper-cased -> real file names in the data directory.
+
+    The data directory is read-only, so it is listed on the first
+    case-insensitive lookup and reused after that.
+    """
+    global _data_names
+    if _data_names is None:
+        try:
+            names = os.listdir(_DATA_DIR)
+        except OSError:
+            names = []
+        # setdefault: first listed wins, as with the old linear scan
+        _data_names = {}
+        for f in names:
+            _data_names.setdefault(f.upper(), f)
+    return _data_names
+
+
 def data_path(filename: str) -> str:
     """Resolve a read-only data file path (case-insensitive lookup)."""
     path = os.path.join(_DATA_DIR, filename)
     if os.path.exists(path):
         return path
-    target = filename.upper()
-    try:
-        for f in os.listdir(_DATA_DIR):
-            if f.upper() == target:
-                return os.path.join(_DATA_DIR, f)
-    except OSError:
-        pass
+    real = _data_casemap().get(filename.upper())
+    if real is not None:
+        return os.path.join(_DATA_DIR, real)
     return path
 
 
@@ -65,13 +83,9 @@ def save_path(filename: str) -> str:
     if os.path.exists(fallback):
         return fallback
     # Case-insensitive fallback in data dir
-    target = filename.upper()
-    try:
-        for f in os.listdir(_DATA_DIR):
-            if f.upper() == target:
-                return os.path.join(_DATA_DIR, f)
-    except OSError:
-        pass
+    real = _data_casemap().get(filename.upper())
+    if real is not None:
+        return os.path.join(_DATA_DIR, real)
     # Default: return save dir path (for new file creation)
     return os.path.join(_SAVE_DIR, filename)
 
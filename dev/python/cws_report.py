@@ -403,11 +403,13 @@ def _battle_report(g: 'GameState', who: int) -> None:
 def _recap(g: 'GameState') -> None:
     """Display game history log."""
     from cws_util import tick
+    from cws_ui import close_history
 
     s = g.screen
     s.cls()                                                 # L187
     x = 0
 
+    close_history(g)
     path = save_path("cws.his")
     try:
         with open(path, 'r') as f:                          # L188
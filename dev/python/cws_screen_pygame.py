@@ -7,7 +7,7 @@ Monochrome low-effort mode: uses simple shapes, no sprites.
 """
 
 import pygame
-from vga_font import get_glyph, CHAR_W as _VGA_CW, CHAR_H as _VGA_CH
+from vga_font import get_text, CHAR_W as _VGA_CW, CHAR_H as _VGA_CH
 
 # ── VGA 16-color palette ─────────────────────────────────────────────────────
 VGA = [
@@ -79,6 +79,8 @@ class PygameScreen:
         self._last_y = 0
         self._draw_color: int | None = None   # persistent DRAW C<n> color
         self._draw_scale: int = 4             # persistent DRAW S<n> scale
+        self._watched: list = []              # rects registered via watch()
+        self.overdrawn = False                # a draw touched a watched rect
 
         # No system font needed — we use the VGA bitmap font from vga_font.py
 
@@ -108,15 +110,11 @@ class PygameScreen:
         y = (self._row - 1) * CHAR_H
         # Clear background behind text
         tw = len(text) * CHAR_W
+        self._touch(x, y, tw, CHAR_H)
         pygame.draw.rect(self.surface, VGA[0], (x, y, tw, CHAR_H))
-        # Blit each character from the VGA bitmap font
-        rgb = self._rgb()
-        for ch in text:
-            code = ord(ch)
-            if 32 <= code <= 126:
-                glyph = get_glyph(code, rgb)
-                self.surface.blit(glyph, (x, y))
-            x += CHAR_W
+        # Blit the whole string, rendered once from the VGA bitmap font
+        if text:
+            self.surface.blit(get_text(text, self._rgb()), (x, y))
         self._col += len(text)
 
     # ── Drawing primitives ────────────────────────────────────────────────
@@ -125,6 +123,7 @@ class PygameScreen:
              style: str = "", pattern: int = 0xFFFF) -> None:
         """Draw line or box. style='B' for box, 'BF' for filled box."""
         rgb = self._rgb(c)
+        self._touch(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
         if "BF" in style.upper():
             # Filled rectangle
             rx = min(x1, x2)
@@ -206,6 +205,7 @@ class PygameScreen:
             rx = max(1, int(r / aspect))
             ry = r
         rect = (x - rx, y - ry, 2 * rx + 1, 2 * ry + 1)
+        self._touch(*rect)
 
         if start is not None and end is not None:
             # Arc mode — pygame.draw.arc uses same convention as QBasic
@@ -227,6 +227,9 @@ class PygameScreen:
     def polygon(self, points, c: int, fill: bool = False) -> None:
         """Draw a polygon. fill=True fills the interior (like PAINT)."""
         rgb = self._rgb(c)
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        self._touch(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
         if fill:
             pygame.draw.polygon(self.surface, rgb, points)
         else:
@@ -234,6 +237,7 @@ class PygameScreen:
 
     def pset(self, x: int, y: int, c: int) -> None:
         """Set a single pixel."""
+        self._touch(x, y, 1, 1)
         if 0 <= x < 640 and 0 <= y < 480:
             self.surface.set_at((x, y), self._rgb(c))
         self._last_x = x
@@ -320,6 +324,8 @@ class PygameScreen:
                 ny = cy + int(dy * dist * scale / 4)
 
                 if not blind:
+                    self._touch(min(cx, nx), min(cy, ny),
+                                abs(nx - cx) + 1, abs(ny - cy) + 1)
                     pygame.draw.line(self.surface, VGA[color_idx],
                                      (cx, cy), (nx, ny))
 
@@ -339,10 +345,15 @@ class PygameScreen:
     def put_image(self, x: int, y: int, sprite) -> None:
         """Blit a stored surface at position."""
         if isinstance(sprite, pygame.Surface):
+            self._touch(x, y, *sprite.get_size())
             self.surface.blit(sprite, (x, y))
 
-    def get_image(self, x1: int, y1: int, x2: int, y2: int):
-        """Capture a rectangle of pixels and return as a Surface."""
+    def get_image(self, x1: int, y1: int, x2: int, y2: int, into=None):
+        """Capture a rectangle of pixels and return as a Surface.
+
+        If `into` is a Surface of the captured size it is overwritten and
+        returned instead of allocating a new one.
+        """
         rx = min(x1, x2)
         ry = min(y1, y2)
         rw = abs(x2 - x1) + 1
@@ -353,11 +364,32 @@ class PygameScreen:
             rw = 640 - rx
         if ry + rh > 480:
             rh = 480 - ry
-        # Create a fully independent copy (no subsurface reference)
-        img = pygame.Surface((rw, rh), flags=self.surface.get_flags())
+        if isinstance(into, pygame.Surface) and into.get_size() == (rw, rh):
+            img = into
+        else:
+            # Create a fully independent copy (no subsurface reference)
+            img = pygame.Surface((rw, rh), flags=self.surface.get_flags())
         img.blit(self.surface, (0, 0), (rx, ry, rw, rh))
         return img
 
+    # ── Overdraw tracking ─────────────────────────────────────────────────
+
+    def watch(self, rects) -> None:
+        """Watch rects (x, y, w, h) for overdraw.
+
+        Resets .overdrawn to False; it turns True as soon as any drawing
+        call touches one of the rects.  Lets a caller skip repainting
+        content that is provably still on screen.  One watcher at a time.
+        """
+        self._watched = [pygame.Rect(r) for r in rects]
+        self.overdrawn = False
+
+    def _touch(self, x: int, y: int, w: int, h: int) -> None:
+        """Note that the box (x, y, w, h) is about to be drawn into."""
+        if self._watched and not self.overdrawn:
+            if pygame.Rect(x, y, w, h).collidelist(self._watched) >= 0:
+                self.overdrawn = True
+
     # ── View/Clipping ─────────────────────────────────────────────────────
 
     def view(self, x1: int = -1, y1: int = -1, x2: int = -1, y2: int = -1) -> None:
@@ -372,8 +404,10 @@ class PygameScreen:
     def cls(self, mode: int = 0) -> None:
         """Clear screen. mode=0: all, mode=1: within current VIEW."""
         if mode == 1 and self._clip:
+            self._touch(*self._clip)
             self.surface.fill(VGA[0], self._clip)
         else:
+            self._touch(0, 0, 640, 480)
             self.surface.fill(VGA[0])
             self._clip = None
             self.surface.set_clip(None)
@@ -396,6 +430,7 @@ class PygameScreen:
         w, h = self.surface.get_size()
         if x < 0 or x >= w or y < 0 or y >= h:
             return
+        self._touch(0, 0, w, h)   # fill extent is unknown up front
 
         start_rgb = tuple(self.surface.get_at((x, y))[:3])
         if start_rgb == tuple(fill_rgb) or start_rgb == tuple(border_rgb):
@@ -440,12 +475,19 @@ class PygameScreen:
 
     # ── Convenience ───────────────────────────────────────────────────────
 
-    def update(self) -> None:
+    def update(self, rects=None) -> None:
         """Push frame to display.
 
         Nearest-neighbor-scales the internal 640x480 surface into the
         display window with aspect-ratio-preserving letterbox/pillarbox,
         keeping every pixel edge sharp (no bilinear blur).
+
+        rects: optional list of (x, y, w, h) in internal coordinates.
+        When given, only those regions are rescaled and pushed with
+        pygame.display.update(); used for small changes like moving a
+        menu highlight.  Falls back to a full frame when the window
+        scale is fractional, where a partial rescale could land on
+        different pixel boundaries than the full one.
         """
         # Always use the live display surface (size changes on resize)
         display = pygame.display.get_surface()
@@ -462,6 +504,21 @@ class PygameScreen:
         ox = (dw - sw) // 2
         oy = (dh - sh) // 2
 
+        k = sw // nw
+        if rects is not None and k >= 1 and sw == nw * k and sh == nh * k:
+            bounds = self.surface.get_rect()
+            dirty = []
+            for r in rects:
+                r = pygame.Rect(r).clip(bounds)
+                if r.w == 0 or r.h == 0:
+                    continue
+                dst = pygame.Rect(ox + r.x * k, oy + r.y * k, r.w * k, r.h * k)
+                pygame.transform.scale(self.surface.subsurface(r), dst.size,
+                                       display.subsurface(dst))
+                dirty.append(dst)
+            pygame.display.update(dirty)
+            return
+
         # Black letterbox/pillarbox bars
         display.fill((0, 0, 0))
 
@@ -476,4 +533,5 @@ class PygameScreen:
 
     def fill_rect(self, x: int, y: int, w: int, h: int, c: int) -> None:
         """Fill a rectangle (convenience wrapper)."""
+        self._touch(x, y, w, h)
         pygame.draw.rect(self.surface, self._rgb(c), (x, y, w, h))
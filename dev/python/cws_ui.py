@@ -27,18 +27,35 @@ Dependencies:
     cws_map:    icon(g, from_, dest, kind), usa(g), image2(g, text, s)
     cws_army:   armystat(g, index)
     cws_report: report(g, who)
+    cws_sound:  qb_sound(freq, duration_ticks)
 """
 
-import os
+import atexit
 import pygame
 from typing import TYPE_CHECKING
 
 from cws_paths import save_path_write
 from cws_globals import UNION, CONFEDERATE
+from cws_map import icon, usa, image2, _clear_arrow
+from cws_army import armystat
+from cws_report import report
+from cws_sound import qb_sound
 
 if TYPE_CHECKING:
     from cws_globals import GameState
 
+# History log location; the save directory is fixed once cws_paths loads
+_HIS_PATH = save_path_write("cws.his")
+
+# Game whose history log scribe() last opened, closed once at exit
+_history_game = None
+
+
+@atexit.register
+def _close_history_at_exit() -> None:
+    if _history_game is not None:
+        close_history(_history_game)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SUB center(y, a$)  -- lines 1-5
@@ -64,8 +81,8 @@ def clrbot(g: 'GameState') -> None:
 
     Original: SUB clrbot -- lines 6-9
     """
-    g.screen.locate(29, 1)                                           # L7
-    g.screen.print_text(" " * 79)
+    # PRINT SPACE$(79) just blanks the cells: fill them as one box
+    g.screen.line(0, 448, 631, 463, 0, "BF")                         # L7
     g.screen.locate(29, 1)                                           # L8
 
 
@@ -95,11 +112,11 @@ def scribe(g: 'GameState', text: str, flag: int) -> None:
 
     Original: SUB scribe(a$, flag) -- lines 16-27
     """
+    global _history_game
     if flag == 1:                                                    # L18
         clrbot(g)
         g.screen.print_text(text)
     elif flag == 2:                                                  # L19
-        from cws_map import image2
         image2(g, text, 4)
 
     # Capture for online event replay
@@ -113,26 +130,81 @@ def scribe(g: 'GameState', text: str, flag: int) -> None:
 
     if g.history > 0:                                                # L21
         try:
-            his_path = save_path_write("cws.his")
-            with open(his_path, "a") as f:                           # L22
-                f.write(text.strip() + "\n")                         # L23-24
-        except IOError:
+            if g.history_fp is None:                                 # L22
+                g.history_fp = open(_HIS_PATH, "a", buffering=8192)
+                _history_game = g
+            g.history_fp.write(text.strip() + "\n")                  # L23-24
+        except OSError:
+            pass
+
+
+def close_history(g: 'GameState') -> None:
+    """Flush and close the history log opened by scribe().
+
+    Call before reading or rewriting cws.his directly; the next scribe()
+    reopens it in append mode.
+    """
+    if g.history_fp is not None:
+        try:
+            g.history_fp.close()
+        except OSError:
             pass
+        g.history_fp = None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SUB topbar  -- lines 28-58
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Pixel boxes (x, y, w, h) that topbar() paints
+_TOPBAR_RECTS = (
+    (0, 0, 640, 16),            # row 1 status line
+    (530, 15, 101, 21),         # VP bar
+    (536, 48, 104, 64),         # rows 4-7 from column 68
+    (552, 144, 72, 16),         # flag label, row 10
+    (568, 165, 35, 23),         # flag
+    (536, 400, 104, 48),        # rows 26-28 from column 68
+)
+
+
 def topbar(g: 'GameState') -> None:
     """Draw the top status bar with side info, VP bar, difficulty, funds.
 
+    Skipped when none of its inputs changed since the last draw and the
+    screen reports nothing has been drawn over it since (see
+    PygameScreen.watch); the colour and cursor still end up as if drawn.
+
     Original: SUB topbar -- lines 28-58
     """
     s = g.screen
 
-    s.locate(1, 1)                                                   # L29
-    s.print_text(" " * 80)
+    for i in range(1, 3):                                            # L38
+        if g.victory[i] < 0:
+            g.victory[i] = 0
+
+    c = g.side_color(g.side)                                         # L41
+
+    # Status string                                                  # L51-53
+    a = "  Snd"
+    if g.noise < 2:
+        a = "   Snd"
+        if g.noise == 0:
+            a = "      "
+    if g.graf > 0:
+        a = a + f" G{g.graf}"
+    if g.player == 3:
+        a = a + " ONLINE"
+    else:
+        a = a + f" {g.player}"
+
+    sig = (g.force[g.side], g.month_names[g.month], g.year, g.side, g.bw,
+           g.difficult, g.cash[g.side], g.victory[1], g.victory[2], a)
+    if sig == g._topbar_sig and not s.overdrawn:
+        s.color(c)
+        s.locate(28, 68 + len(a))
+        return
+
+    s.line(0, 0, 639, 15, 0, "BF")                                   # L29
     s.color(11)                                                      # L30
     s.locate(1, 10)                                                  # L31
     s.print_text(f"Input your decisions now for {g.force[g.side]} side ")
@@ -150,13 +222,8 @@ def topbar(g: 'GameState') -> None:
     s.locate(7, 68)                                                  # L36
     s.print_text(f"Funds:{g.cash[g.side]}")
 
-    for i in range(1, 3):                                            # L38
-        if g.victory[i] < 0:
-            g.victory[i] = 0
-
     x = g.victory[1] + g.victory[2]                                  # L40
     y = 0
-    c = g.side_color(g.side)                                         # L41
     s.line(580, 15, 580, 35, 15)                                     # L42
     s.line(530, 20, 630, 30, 8 - c, "BF")                           # L43
     if x > 0:                                                        # L44
@@ -170,19 +237,6 @@ def topbar(g: 'GameState') -> None:
     s.locate(5, 68)                                                  # L49
     s.print_text(f"( {y} %)")
 
-    # Status string                                                  # L51-53
-    a = "  Snd"
-    if g.noise < 2:
-        a = "   Snd"
-        if g.noise == 0:
-            a = "      "
-    if g.graf > 0:
-        a = a + f" G{g.graf}"
-    if g.player == 3:
-        a = a + " ONLINE"
-    else:
-        a = a + f" {g.player}"
-
     s.color(c)                                                       # L54
     s.locate(26, 68)                                                 # L55
     s.print_text("F3 Redrw Scrn")
@@ -191,6 +245,9 @@ def topbar(g: 'GameState') -> None:
     s.locate(28, 68)                                                 # L57
     s.print_text(a)
 
+    g._topbar_sig = sig
+    s.watch(_TOPBAR_RECTS)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SUB mxw(wide)  -- lines 243-249
@@ -200,12 +257,20 @@ def mxw(g: 'GameState') -> int:
     """Calculate maximum width needed for current menu items.
 
     Original: SUB mxw(wide) -- lines 243-249
+
+    The result is cached on g keyed by the item strings, so redraws of
+    the same menu (F3/F8) skip the rescan.
     """
-    wide = len(g.mtx[0]) + 1                                        # L244
-    for i in range(1, g.size + 1):                                   # L245
-        x = len(g.mtx[i])                                           # L246
+    items = tuple(g.mtx[:g.size + 1])
+    cached = g._mxw_cache
+    if cached is not None and cached[0] == items:
+        return cached[1]
+    wide = len(items[0]) + 1                                         # L244
+    for item in items[1:]:                                           # L245
+        x = len(item)                                                # L246
         if x > wide:                                                 # L247
             wide = x
+    g._mxw_cache = (items, wide)
     return wide
 
 
@@ -213,6 +278,8 @@ def mxw(g: 'GameState') -> int:
 # SUB choices(b1, wide)  -- lines 59-76
 # ─────────────────────────────────────────────────────────────────────────────
 
+_MENU_IMAGES_MAX = 16     # finished menu boxes kept for choices()
+
 def choices(g: 'GameState', b1: int, wide: int) -> None:
     """Render the menu box, title, separator, and option text.
 
@@ -231,6 +298,18 @@ def choices(g: 'GameState', b1: int, wide: int) -> None:
     y1 = 16 * g.tly - 11
     x2 = 8 * (g.tlx + wide + 1) + 7
     y2 = 16 * (g.tly + g.size + 2) + 8
+
+    # The finished box depends only on its contents, not its position,
+    # so a box drawn before is stamped back in one blit.
+    on_screen = x1 >= 0 and y1 >= 0 and x2 < 640 and y2 < 480
+    key = (tuple(g.mtx[:g.size + 1]), wide, b1,
+           abs(g.wtype) == 2, g.colour)
+    if on_screen and key in g._menu_images:
+        s.view()
+        s.put_image(x1, y1, g._menu_images[key])
+        s.color(g.colour)
+        return
+
     s.view(x1, y1, x2, y2)
     s.cls(1)
     s.view()
@@ -261,6 +340,11 @@ def choices(g: 'GameState', b1: int, wide: int) -> None:
         s.locate(g.tly + 2 + i, g.tlx + 2)
         s.print_text(g.mtx[i])
 
+    if on_screen:
+        if len(g._menu_images) >= _MENU_IMAGES_MAX:
+            del g._menu_images[next(iter(g._menu_images))]
+        g._menu_images[key] = s.get_image(x1, y1, x2, y2)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SUB menu(switch%)  -- lines 77-242
@@ -289,13 +373,15 @@ def choices(g: 'GameState', b1: int, wide: int) -> None:
 #   9 = highlight city with arrow (icon 9/8)
 # ─────────────────────────────────────────────────────────────────────────────
 
+# switch=8 faces before load_all_sprites() has run
+_EMPTY_DICT = {}
+
+
 def menu(g: 'GameState', switch: int) -> int:
     """Interactive menu. Returns selection in g.choose.
 
     Original: SUB menu(switch%) -- lines 77-242
     """
-    from cws_map import icon
-
     s = g.screen
 
     # ── remenu: initialization ────────────────────────────────────  L78-115
@@ -332,86 +418,97 @@ def menu(g: 'GameState', switch: int) -> int:
 
     # Draw menu                                                      # L115
     choices(g, b1, wide)
+    letters = _letter_index(g)
 
     flag = 0  # local flag for switch=2 defender display
+    face_surfs = getattr(g, 'face_surfaces', _EMPTY_DICT)  # switch=8 faces
+    full_update = True  # False once only the highlight rows need pushing
+    drawn_row = 0       # row currently highlighted on screen (0 = none)
 
     # ── sel1: main selection loop ─────────────────────────────────  L116+
     while True:
-        # Always clean any leftover arrow before drawing a new one
-        from cws_map import _clear_arrow
-        _clear_arrow(g)
-
-        # Switch-specific highlighting at sel1                       # L117-155
-        if switch == 1:                                              # L118
-            icon(g, g.array[row], 0, 7)
-        elif switch == 2:                                            # L119-134
-            icon(g, g.array[row], 0, 9)
-            target = g.occupied[g.array[row]]                        # L120
-            if target > 0:                                           # L121
-                flag = 1                                             # L122
-                t = g.armyname[target]                               # L123
-                if len(t) > wide:                                    # L124
-                    t = t[:wide]
-                s.color(12)                                          # L125
-                s.locate(g.tly + 2 + row, g.tlx + 2)                # L126
-                s.print_text(" " * wide)
-                s.locate(g.tly + 2 + row, g.tlx + 2)                # L127
-                s.print_text(t)
-                s.locate(g.tly + 4 + g.size, g.tlx + 1)             # L128
-                s.print_text(" " * 12)
-                s.locate(g.tly + 4 + g.size, g.tlx + 1)             # L129
-                s.print_text(f"Size {g.armysize[target]}00")         # L129-130
+        # Redraw only when the highlighted row changed (or the screen
+        # was rebuilt); keys that do nothing go straight back to waiting.
+        if row != drawn_row:
+            # Always clean any leftover arrow before drawing a new one
+            _clear_arrow(g)
+
+            # Switch-specific highlighting at sel1                   # L117-155
+            if switch == 1:                                          # L118
+                icon(g, g.array[row], 0, 7)
+            elif switch == 2:                                        # L119-134
+                icon(g, g.array[row], 0, 9)
+                target = g.occupied[g.array[row]]                    # L120
+                if target > 0:                                       # L121
+                    flag = 1                                         # L122
+                    t = g.armyname[target]                           # L123
+                    if len(t) > wide:                                # L124
+                        t = t[:wide]
+                    s.color(12)                                      # L125
+                    s.locate(g.tly + 2 + row, g.tlx + 2)            # L126
+                    s.print_text(" " * wide)
+                    s.locate(g.tly + 2 + row, g.tlx + 2)            # L127
+                    s.print_text(t)
+                    s.locate(g.tly + 4 + g.size, g.tlx + 1)         # L128
+                    s.print_text(" " * 12)
+                    s.locate(g.tly + 4 + g.size, g.tlx + 1)         # L129
+                    s.print_text(f"Size {g.armysize[target]}00")     # L129-130
+                else:
+                    flag = 0                                         # L132
+                    s.locate(g.tly + 4 + g.size, g.tlx + 1)         # L133
+                    s.print_text(" " * 12)
+            elif switch == 4:                                        # L135
+                armystat(g, g.array[row])
+            elif switch == 5:                                        # L136
+                s.color(11)
+                clrbot(g)
+                # NOTE: 'index' here refers to the caller's context.
+                # In QB64 this was a shared local. We use g.array[row] as index.
+                idx = g.array[row]
+                s.print_text(
+                    f"{g.armyname[idx]}  Exp={g.armyexper[idx]}"
+                    f" Cash={g.cash[g.side]}"
+                )
+            elif switch == 6:                                        # L137
+                icon(g, g.armyloc[g.array[row]], 0, 9)
+            elif switch == 8:                                        # L138-153
+                # Commander face graphic
+                if g.graf > 2 and row > 0:
+                    s.line(548, 148, 592, 216, 15, "B")             # L140
+                    a = row                                          # L141
+                    if g.side == UNION:
+                        a = 6 - row
+                    if a in face_surfs:
+                        s.put_image(550, 150, face_surfs[a])         # L147
+                        if g.side == CONFEDERATE:                      # L148-151
+                            s.paint(560, 160, 8, 0)
+                            s.paint(570, 155, 7, 0)
+            elif switch == 9:                                        # L154
+                icon(g, g.array[row], 0, 9)
+
+            # Highlight current row                                  # L156-161
+            if flag == 0:
+                s.color(g.hilite)                                    # L157
+                s.locate(g.tly + 2 + row, g.tlx + 2)                # L158
+                s.print_text(g.mtx[row])                             # L159
+                if g.bw > 0:                                         # L160
+                    s.line(8 * (g.tlx + 1),
+                           16 * (g.tly + row + 1),
+                           8 * (g.tlx + len(g.mtx[row]) + 1) - 1,
+                           16 * (g.tly + row + 2) - 1,
+                           g.hilite, "B")
+
+            # Plain menus only touched the old and new rows; other switches
+            # also draw on the map or side panels, so push the whole frame.
+            if full_update or switch != 0:
+                s.update()
+                full_update = False
             else:
-                flag = 0                                             # L132
-                s.locate(g.tly + 4 + g.size, g.tlx + 1)             # L133
-                s.print_text(" " * 12)
-        elif switch == 4:                                            # L135
-            from cws_army import armystat
-            armystat(g, g.array[row])
-        elif switch == 5:                                            # L136
-            s.color(11)
-            clrbot(g)
-            # NOTE: 'index' here refers to the caller's context.
-            # In QB64 this was a shared local. We use g.array[row] as index.
-            idx = g.array[row] if hasattr(g, 'array') else row
-            s.print_text(
-                f"{g.armyname[idx]}  Exp={g.armyexper[idx]}"
-                f" Cash={g.cash[g.side]}"
-            )
-        elif switch == 6:                                            # L137
-            icon(g, g.armyloc[g.array[row]], 0, 9)
-        elif switch == 8:                                            # L138-153
-            # Commander face graphic
-            if g.graf > 2 and row > 0:
-                s.line(548, 148, 592, 216, 15, "B")                 # L140
-                a = row                                              # L141
-                if g.side == UNION:
-                    a = 6 - row
-                face_surfs = getattr(g, 'face_surfaces', {})
-                if a in face_surfs:
-                    s.put_image(550, 150, face_surfs[a])             # L147
-                    if g.side == CONFEDERATE:                          # L148-151
-                        s.paint(560, 160, 8, 0)
-                        s.paint(570, 155, 7, 0)
-        elif switch == 9:                                            # L154
-            icon(g, g.array[row], 0, 9)
-
-        # Highlight current row                                      # L156-161
-        if flag == 0:
-            s.color(g.hilite)                                        # L157
-            s.locate(g.tly + 2 + row, g.tlx + 2)                    # L158
-            s.print_text(g.mtx[row])                                 # L159
-            if g.bw > 0:                                             # L160
-                s.line(8 * (g.tlx + 1),
-                       16 * (g.tly + row + 1),
-                       8 * (g.tlx + len(g.mtx[row]) + 1) - 1,
-                       16 * (g.tly + row + 2) - 1,
-                       g.hilite, "B")
-
-        s.update()
+                s.update([_row_rect(g, row1, wide), _row_rect(g, row, wide)])
+            drawn_row = row
 
         # ── crsr: wait for key input ──────────────────────────────  L182+
-        key_result = _wait_menu_key(g)
+        key_result = _wait_menu_key(g, letters)
         action = key_result["action"]
         key_char = key_result.get("char", "")
 
@@ -453,11 +550,13 @@ def menu(g: 'GameState', switch: int) -> int:
             break  # goto called
 
         if action == "f3":                                           # L200-205
-            from cws_map import usa
             s.cls()
             usa(g)
             choices(g, b1, wide)
             topbar(g)
+            letters = _letter_index(g)
+            full_update = True
+            drawn_row = 0
             continue  # back to sel1
 
         if action == "f7":                                           # L207-209
@@ -465,10 +564,12 @@ def menu(g: 'GameState', switch: int) -> int:
             break  # goto called
 
         if action == "f8":                                           # L212-216
-            from cws_report import report
             report(g, -1)
             choices(g, b1, wide)
             topbar(g)
+            letters = _letter_index(g)
+            full_update = True
+            drawn_row = 0
             continue  # back to sel1
 
         # Arrow navigation                                          # L193-199
@@ -477,20 +578,18 @@ def menu(g: 'GameState', switch: int) -> int:
             # then RETURNs to reglr: which unhighlights row1.
             row1 = row                                               # L195
 
-            if action == "up":                                       # L196
-                row -= 1
-            elif action == "down":                                   # L198
-                row += 1
-            elif action == "home":                                   # L197
+            if action == "home":                                     # L197
                 row = 1
             elif action == "end":                                    # L199
                 row = g.size
+            else:                                                    # L196, L198
+                # up/down, wrapped within 1..size (limits: L220-223)
+                row = (row - 1 + _ARROW_STEP[action]) % max(g.size, 1) + 1
 
-            # limits:                                                # L220-223
-            if row > g.size:
-                row = 1
-            if row < 1:
-                row = g.size
+            # Home on the first row, End on the last, or any arrow in a
+            # one-item menu lands where we already are: nothing to redo.
+            if row == row1:
+                continue
 
             # reglr: unhighlight old row                             # L169-171
             if switch == 2:                                          # L169
@@ -501,7 +600,6 @@ def menu(g: 'GameState', switch: int) -> int:
             s.print_text(g.mtx[row1])
 
             # Clean up old row's icon                                # L173-178
-            from cws_map import _clear_arrow
             _clear_arrow(g)                                          # erase arrow (kinds 9)
             if switch == 1:                                          # L174 (kind 7 highlight box)
                 if g.mtx[row1] != "EXIT":                            # L175
@@ -509,18 +607,17 @@ def menu(g: 'GameState', switch: int) -> int:
 
             g.choose = row                                           # L180
             flag = 0  # reset for next iteration
+            drawn_row = 0  # row1 was just unhighlighted
             continue  # goto sel1                                    # L181
 
     # ── called: cleanup and return ────────────────────────────────  L231-242
     if g.noise > 0:                                                  # L232
-        from cws_sound import qb_sound
         qb_sound(700, 0.5)
     s.color(g.colour)                                                # L233
     g.tlx = 0                                                        # L234
     g.tly = 0
 
     # Restore icon for current row                                   # L235-240
-    from cws_map import _clear_arrow
     _clear_arrow(g)                                                  # erase arrow (kinds 9)
     if switch == 1:                                                  # L236 (kind 7 highlight box)
         icon(g, g.array[row], 0, 8)                                  # L237
@@ -529,69 +626,89 @@ def menu(g: 'GameState', switch: int) -> int:
     return g.choose
 
 
-def _wait_menu_key(g: 'GameState') -> dict:
+# Row step for the wrapping arrow keys in menu()
+_ARROW_STEP = {"up": -1, "down": 1}
+
+
+def _row_rect(g: 'GameState', row: int, wide: int) -> tuple:
+    """Pixel rect (x, y, w, h) covering menu option `row`."""
+    return (8 * (g.tlx + 1), 16 * (g.tly + row + 1), 8 * wide, 16)
+
+
+def _letter_index(g: 'GameState') -> dict:
+    """Map each item's upper-cased first letter to its row (first wins).
+
+    Built once per menu draw so a shortcut key is a single dict lookup
+    instead of a rescan of g.mtx on every keypress.
+    """
+    letters = {}
+    for k in range(1, g.size + 1):                                   # L188
+        item = g.mtx[k].lstrip()
+        if item:
+            letters.setdefault(item[0].upper(), k)
+    return letters
+
+
+def _wait_menu_key(g: 'GameState', letters: dict) -> dict:
     """Wait for a meaningful key press in the menu context.
 
     Replaces the GOSUB crsr / arrows block (lines 182-218).
     Returns a dict with 'action' and optional extra fields.
+    `letters` is the first-letter shortcut table from _letter_index().
 
     Mapped from QB64 INKEY$ scan codes:
         Up=H(72), Down=P(80), PgUp=I(73), PgDn=Q(81)
         F3==(61), F7=A(65), F4=>(62), F8=B(66)
     """
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                raise SystemExit
-
-            if event.type == pygame.VIDEORESIZE:
-                g.screen.update()
-
-            if event.type == pygame.KEYDOWN:
-                key = event.key
-
-                # Enter                                              # L183
-                if key == pygame.K_RETURN:
-                    return {"action": "enter"}
-
-                # Escape                                             # L186
-                if key == pygame.K_ESCAPE:
-                    return {"action": "escape", "char": chr(27)}
-
-                # Arrow keys                                         # L196-199
-                if key == pygame.K_UP:
-                    return {"action": "up"}
-                if key == pygame.K_DOWN:
-                    return {"action": "down"}
-                if key in (pygame.K_HOME, pygame.K_PAGEUP):
-                    return {"action": "home"}
-                if key in (pygame.K_END, pygame.K_PAGEDOWN):
-                    return {"action": "end"}
-
-                # F-keys                                             # L200-217
-                if key == pygame.K_F3:
-                    return {"action": "f3"}
-                if key == pygame.K_F7:
-                    return {"action": "f7"}
-                if key == pygame.K_F8:
-                    return {"action": "f8"}
-
-                # Printable character                                # L184-191
-                if event.unicode and len(event.unicode) == 1:
-                    ch = event.unicode
-                    if ch.isalpha():
-                        # Try to match first letter of a menu item   # L188-191
-                        for k in range(1, g.size + 1):
-                            item = g.mtx[k].lstrip()
-                            if item:
-                                c1 = item[0].upper()
-                                if c1 == ch.upper():
-                                    return {"action": "letter_match",
-                                            "match": k, "char": ch}
-                        # No match -- in switch=3, still return char
-                        return {"action": "char", "char": ch}
-
-        pygame.time.wait(16)
+        # Block until the next event: no polling delay after the redraw
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            raise SystemExit
+
+        if event.type == pygame.VIDEORESIZE:
+            g.screen.update()
+
+        if event.type == pygame.KEYDOWN:
+            key = event.key
+
+            # Enter                                                  # L183
+            if key == pygame.K_RETURN:
+                return {"action": "enter"}
+
+            # Escape                                                 # L186
+            if key == pygame.K_ESCAPE:
+                return {"action": "escape", "char": chr(27)}
+
+            # Arrow keys                                             # L196-199
+            if key == pygame.K_UP:
+                return {"action": "up"}
+            if key == pygame.K_DOWN:
+                return {"action": "down"}
+            if key in (pygame.K_HOME, pygame.K_PAGEUP):
+                return {"action": "home"}
+            if key in (pygame.K_END, pygame.K_PAGEDOWN):
+                return {"action": "end"}
+
+            # F-keys                                                 # L200-217
+            if key == pygame.K_F3:
+                return {"action": "f3"}
+            if key == pygame.K_F7:
+                return {"action": "f7"}
+            if key == pygame.K_F8:
+                return {"action": "f8"}
+
+            # Printable character                                    # L184-191
+            if event.unicode and len(event.unicode) == 1:
+                ch = event.unicode
+                if ch.isalpha():
+                    # Try to match first letter of a menu item       # L188-191
+                    k = letters.get(ch.upper())
+                    if k is not None:
+                        return {"action": "letter_match",
+                                "match": k, "char": ch}
+                    # No match -- in switch=3, still return char
+                    return {"action": "char", "char": ch}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -612,7 +729,15 @@ def flags(g: 'GameState', who: int, w: int, a: int) -> None:
     if a != 0:                                                       # L252
         y = a
 
-    if who == UNION:                                                  # L254: Union flag
+    if who in g._flag_images:
+        # The flags are opaque and position-independent: reuse the capture
+        s.put_image(x - 17, y - 15, g._flag_images[who])
+        if w == 0:
+            s.color(9 if who == UNION else 4)
+            s.locate(10, 70)
+            s.print_text("U N I O N" if who == UNION else "R E B E L")
+
+    elif who == UNION:                                                # L254: Union flag
         s.line(x - 17, y - 15, x + 17, y + 7, 4, "BF")             # L255
         for i in range(-13, 10, 5):                                  # L256-258
             s.line(x - 17, y + i, x + 17, y + i - 1, 7, "B")
@@ -624,6 +749,8 @@ def flags(g: 'GameState', who: int, w: int, a: int) -> None:
         for i in range(-16, 0, 3):                                   # L261-263
             for j in range(-14, 0, 4):
                 s.pset(x + i, y + j, 7)
+        if _flag_on_screen(x, y):
+            g._flag_images[who] = s.get_image(x - 17, y - 15, x + 17, y + 7)
 
     elif who == CONFEDERATE:                                          # L264: Confederate flag
         s.line(x - 17, y - 15, x + 17, y + 7, 4, "BF")             # L265
@@ -643,6 +770,8 @@ def flags(g: 'GameState', who: int, w: int, a: int) -> None:
         s.line(x - 16, y - 15, x + 17, y + 6, 1)
         # Border                                                    # L278
         s.line(x - 17, y - 15, x + 17, y + 7, 4, "B")
+        if _flag_on_screen(x, y):
+            g._flag_images[who] = s.get_image(x - 17, y - 15, x + 17, y + 7)
 
         if w == 0:                                                   # L280
             s.color(4)
@@ -650,42 +779,29 @@ def flags(g: 'GameState', who: int, w: int, a: int) -> None:
             s.print_text("R E B E L")
 
 
+def _flag_on_screen(x: int, y: int) -> bool:
+    """True if the flag box around (x, y) is fully inside the 640x480 screen."""
+    return x - 17 >= 0 and y - 15 >= 0 and x + 17 < 640 and y + 7 < 480
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # SUB roman(target, a$)  -- lines 284-308
 # ─────────────────────────────────────────────────────────────────────────────
 
+_ROMAN_ONES = ("", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X")
+
+
 def roman(target: int) -> str:
     """Generate roman numeral army name like 'Union III' or 'Rebel VII'.
 
     NOTE: In original QB64, target is modified in-place (subtracted).
-    Here we work on a local copy.
+    Here we work on a local copy. target is an army index (1-40), so
+    the ones digit is always a valid _ROMAN_ONES index.
 
     Original: SUB roman(target, a$) -- lines 284-308
     """
-    n = target
-    a = "Union "                                                     # L285
-    if n > 20:
-        a = "Rebel "
-    if n > 20:                                                       # L286
-        n = n - 20
+    prefix = "Rebel " if target > 20 else "Union "                   # L285
+    n = target - 20 if target > 20 else target                       # L286
     if n > 10:                                                       # L287
-        a = a + "X"
-        n = n - 10
-
-    if n < 4:                                                        # L289
-        # add1s: GOSUB                                               # L290, L304-306
-        if n > 0:
-            a = a + "I" * n
-    elif n == 4:                                                     # L291-292
-        a = a + "IV"
-    elif 5 <= n <= 8:                                                # L293-296
-        a = a + "V"
-        x = n - 5
-        if x > 0:
-            a = a + "I" * x
-    elif n == 9:                                                     # L297-298
-        a = a + "IX"
-    elif n == 10:                                                    # L299-300
-        a = a + "X"
-
-    return a
+        return prefix + "X" + _ROMAN_ONES[n - 10]
+    return prefix + _ROMAN_ONES[n]                                   # L289-300
@@ -4,7 +4,7 @@ Direct port of cws_util.bm.
 Contains:
     starfin(g, who) -> (star, fin)
     tick(g, seconds)
-    bubble(g, size)
+    bubble(g, limit)
     bub2(g, limit)
     animate(g, index, flag)
     normal(xbar, vary) -> result
@@ -16,19 +16,26 @@ import random
 import pygame
 from typing import TYPE_CHECKING
 
+from cws_sound import qb_sound
+
 if TYPE_CHECKING:
     from cws_globals import GameState
 
 
+# (star, fin) army index ranges, indexed by who == 2
+_STARFIN = ((1, 20), (21, 40))
+
+
 def starfin(g: 'GameState', who: int) -> tuple:
     """Return (star, fin) index range for a side's armies.
 
     Original: SUB starfin(star, fin, who)
         star = 1: fin = 20: IF who = 2 THEN star = 21: fin = 40
     """
-    if who == 2:
-        return (21, 40)
-    return (1, 20)
+    return _STARFIN[who == 2]
+
+
+_FRAME_MS = 16  # one display frame at ~60 Hz
 
 
 def tick(g: 'GameState', seconds: float) -> None:
@@ -40,48 +47,63 @@ def tick(g: 'GameState', seconds: float) -> None:
     """
     if seconds <= 0:
         return
-    g.screen.update()
     ms = int(seconds * 1000)
-    start = pygame.time.get_ticks()
-    while pygame.time.get_ticks() - start < ms:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                raise SystemExit
-            if event.type == pygame.VIDEORESIZE:
-                g.screen.update()
-            if event.type == pygame.KEYDOWN:
-                return  # any key press skips delay
-        pygame.time.wait(16)  # ~60fps
+    if ms < _FRAME_MS:
+        # Shorter than a frame: a repaint would not be seen before the
+        # next one, so just sleep and leave it to the caller's next update
+        pygame.time.delay(ms)
+        return
+    g.screen.update()
+    _wait_until(g, pygame.time.get_ticks() + ms)
+
+
+def _wait_until(g: 'GameState', deadline: int) -> None:
+    """Handle events until get_ticks() reaches deadline or a key is pressed.
+
+    The key press is consumed, as INKEY$ does in TICK.
+    """
+    remaining = deadline - pygame.time.get_ticks()
+    while remaining > 0:
+        # Sleep in SDL until an event arrives or the delay runs out
+        event = pygame.event.wait(remaining)
+        if event.type == pygame.NOEVENT:
+            return  # timed out: the full delay has passed
+        if event.type == pygame.QUIT:
+            raise SystemExit
+        if event.type == pygame.VIDEORESIZE:
+            # A window drag queues a burst of these: repaint once for all
+            pygame.event.get(pygame.VIDEORESIZE)
+            g.screen.update()
+        if event.type == pygame.KEYDOWN:
+            return  # any key press skips delay
+        remaining = deadline - pygame.time.get_ticks()
 
 
 def bubble(g: 'GameState', limit: int) -> None:
-    """Bubble sort mtx$[1..limit] and array[1..limit] together.
+    """Sort mtx$[1..limit] and array[1..limit] together.
 
     Original: SUB bubble(limit)
-    Sorts mtx$ alphabetically, keeping array in sync.
+    Sorts mtx$ alphabetically, keeping array in sync. The original's
+    bubble sort is stable, and so is sorted(), so ties keep their order.
     """
-    swapped = True
-    while swapped:
-        swapped = False
-        for i in range(1, limit):
-            if g.mtx[i] > g.mtx[i + 1]:
-                g.mtx[i], g.mtx[i + 1] = g.mtx[i + 1], g.mtx[i]
-                g.array[i], g.array[i + 1] = g.array[i + 1], g.array[i]
-                swapped = True
+    order = sorted(range(1, limit + 1), key=g.mtx.__getitem__)
+    g.mtx[1:limit + 1] = [g.mtx[i] for i in order]
+    g.array[1:limit + 1] = [g.array[i] for i in order]
 
 
 def bub2(g: 'GameState', limit: int) -> None:
-    """Bubble sort brray[1..limit] numerically.
+    """Sort brray[1..limit] numerically.
 
     Original: SUB bub2(limit)
     """
-    swapped = True
-    while swapped:
-        swapped = False
-        for i in range(1, limit):
-            if g.brray[i] > g.brray[i + 1]:
-                g.brray[i], g.brray[i + 1] = g.brray[i + 1], g.brray[i]
-                swapped = True
+    g.brray[1:limit + 1] = sorted(g.brray[1:limit + 1])
+
+
+# animate() step weights (i, 10 - i) for i = 2..8. Screen coordinates are
+# non-negative ints, so // 10 gives the same result as INT(.1 * ...).
+_ANIM_T = tuple((i, 10 - i) for i in range(2, 9))
+# At the "Fast" display speed (turbo 1) only steps i = 2, 5, 8 are shown
+_ANIM_T_FAST = _ANIM_T[0::3]
 
 
 def animate(g: 'GameState', index: int, flag: int) -> None:
@@ -111,7 +133,7 @@ def animate(g: 'GameState', index: int, flag: int) -> None:
             s.line(x - 9, y - 8, x + 10, y + 8, 2, "BF")
     # already:                                               L13
 
-    anima = getattr(g, '_anima', None)
+    anima = g._anima
     if anima is None:
         g.armyloc[index] = from_
         return
@@ -121,15 +143,22 @@ def animate(g: 'GameState', index: int, flag: int) -> None:
     tx = g.cityx[to2]
     ty = g.cityy[to2]
 
-    for i in range(2, 9):                                   # L15: FOR i = 2 TO 8
-        x1 = int(0.1 * (i * tx + (10 - i) * fx))          # L16
-        y1 = int(0.1 * (i * ty + (10 - i) * fy))          # L17
-        image = s.get_image(x1 - 10, y1 - 10, x1 + 9, y1 + 9)  # L18
+    image = None                                            # reused each step
+    frame_ms = 100 if g.turbo > 1 else 20                   # L20: TICK .1 / .02
+    steps = _ANIM_T if g.turbo > 1 else _ANIM_T_FAST
+    frame_end = pygame.time.get_ticks()                     # frame 1 starts now
+    for a, b in steps:                                      # L15: FOR i = 2 TO 8
+        x1 = (a * tx + b * fx) // 10                       # L16
+        y1 = (a * ty + b * fy) // 10                       # L17
+        image = s.get_image(x1 - 10, y1 - 10, x1 + 9, y1 + 9, image)  # L18
         s.put_image(x1 - 10, y1 - 10, anima)               # L19
-        delay = 0.1 if g.turbo > 1 else 0.02               # L20
-        tick(g, delay)
+        s.update()                                          # L20
+        # Frames are timed from the start, so drawing time doesn't add up;
+        # a key press ends this frame early and is used up, as in TICK
+        frame_end += frame_ms
+        _wait_until(g, frame_end)
+        frame_end = min(frame_end, pygame.time.get_ticks())
         if g.noise > 0:                                     # L21
-            from cws_sound import qb_sound
             qb_sound(200, 0.1)
             qb_sound(50, 0.1)
         s.put_image(x1 - 10, y1 - 10, image)               # L22
@@ -141,9 +170,10 @@ def normal(xbar: int, vary: int) -> int:
     """Generate normal-distributed random value.
 
     Original: SUB normal(xbar, vary, result)
-    Uses sum of 12 uniforms approximation.
+    The original sums 12 uniforms and subtracts 5.5: mean 0.5, variance 1.
+    One gauss() draw with the same mean and variance replaces the 12.
     """
-    pct = sum(random.random() for _ in range(12)) - 5.5
+    pct = random.gauss(0.5, 1.0)
     return int(xbar + pct * math.sqrt(vary))
 
 
@@ -152,11 +182,11 @@ def stax(g: 'GameState', who: int) -> None:
 
     Original: SUB stax(who)
     """
-    star, fin = starfin(g, who)
+    star, fin = _STARFIN[who == 2]
+    armyloc, armysize, occupied = g.armyloc, g.armysize, g.occupied
     for i in range(star, fin + 1):
-        if g.armysize[i] > 0 and g.occupied[g.armyloc[i]] != i:
-            target = g.armyloc[i]
-            if target > 0:
-                x = g.cityx[target] - 12
-                y = g.cityy[target] - 12
-                g.screen.circle(x, y, 3, 14)
+        target = armyloc[i]
+        if target > 0 and armysize[i] > 0 and occupied[target] != i:
+            x = g.cityx[target] - 12
+            y = g.cityy[target] - 12
+            g.screen.circle(x, y, 3, 14)
@@ -5,6 +5,8 @@ Two fonts:
   2. QB DRAW-string mini font (A-Z, 6px wide) for city name labels.
 """
 
+from collections import OrderedDict
+
 import pygame
 
 CHAR_W = 8
@@ -150,6 +152,37 @@ def get_glyph(char_code: int, rgb: tuple) -> pygame.Surface:
     return surf
 
 
+# Whole-string surfaces: {(text, color_tuple): Surface}, oldest use first
+_text_cache: OrderedDict = OrderedDict()
+_TEXT_CACHE_MAX = 512
+
+
+def get_text(text: str, rgb: tuple) -> pygame.Surface:
+    """Return a (8*len) x 16 Surface of *text* tinted to *rgb*.
+
+    Repeated strings (status bar labels, menu items) are served from an
+    LRU cache so they cost one blit instead of one per character.
+    Characters outside ASCII 32-126 are left transparent.
+    """
+    key = (text, rgb)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        return surf
+
+    surf = pygame.Surface((len(text) * CHAR_W, CHAR_H), pygame.SRCALPHA)
+    x = 0
+    for ch in text:
+        code = ord(ch)
+        if 32 <= code <= 126:
+            surf.blit(get_glyph(code, rgb), (x, 0))
+        x += CHAR_W
+    _text_cache[key] = surf
+    if len(_text_cache) > _TEXT_CACHE_MAX:
+        _text_cache.popitem(last=False)
+    return surf
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  QB DRAW-string mini font for city name labels (A-Z only, ~5x5 px)
 # ═══════════════════════════════════════════════════════════════════════════
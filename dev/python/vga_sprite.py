@@ -19,6 +19,12 @@ from cws_screen_pygame import VGA
 from cws_paths import data_path as _data_path
 
 
+# Decoded sprites for this process: {filename: (width, height, indices)}.
+# Kept as colour indices, not Surfaces, so each load still builds a fresh
+# Surface in the current display format that callers may modify.
+_decoded = {}
+
+
 def load_vga_sprite(filename: str) -> pygame.Surface:
     """Load a QB64 BSAVE sprite file and return a pygame Surface.
 
@@ -28,6 +34,22 @@ def load_vga_sprite(filename: str) -> pygame.Surface:
     Returns:
         pygame.Surface with the decoded sprite, pixel-exact VGA colors.
     """
+    decoded = _decoded.get(filename)
+    if decoded is None:
+        decoded = _decoded[filename] = _read_sprite(filename)
+    width, height, indices = decoded
+
+    # ── Map colour indices through the VGA palette ──
+    indexed = pygame.image.frombytes(indices, (width, height), "P")
+    indexed.set_palette(VGA)
+
+    surf = pygame.Surface((width, height))
+    surf.blit(indexed, (0, 0))
+    return surf
+
+
+def _read_sprite(filename: str) -> tuple:
+    """Read and decode a .VGA file to (width, height, colour indices)."""
     path = _data_path(filename)
     with open(path, "rb") as f:
         raw = f.read()
@@ -44,36 +66,40 @@ def load_vga_sprite(filename: str) -> pygame.Surface:
     height     = struct.unpack_from('<H', payload, 2)[0]
 
     width = width_bits  # SCREEN 12: 1 bit per pixel per plane
+
+    return width, height, bytes(_decode_planes(payload, width, height))
+
+
+# Each plane byte unpacked to 8 bytes of 0/1, leftmost pixel first
+_BITS = tuple(bytes((b >> (7 - i)) & 1 for i in range(8)) for b in range(256))
+
+
+def _decode_planes(payload: bytes, width: int, height: int) -> bytearray:
+    """Decode planar scan lines into one colour index (0-15) per pixel.
+
+    Returns width*height bytes, row-major, ready for an 8-bit paletted
+    Surface. Each plane row is unpacked to one 0/1 byte per pixel and read
+    as a big integer; shifting plane k left by k bits then OR-ing the four
+    lands every plane bit in its own pixel byte, a whole row at a time.
+    """
     bytes_per_plane = (width + 7) // 8
     row_stride = bytes_per_plane * 4          # 4 planes per scan line
-
-    # ── Decode into pixel array ──
-    surf = pygame.Surface((width, height))
-    pix = pygame.PixelArray(surf)             # fast pixel access
+    row_len = bytes_per_plane * 8             # pixels incl. byte padding
+    unpack = _BITS.__getitem__
+    out = bytearray()
 
     offset = 4                                # past header
     for y in range(height):
-        # Grab the 4 plane slices for this row
-        p0 = payload[offset                         : offset + bytes_per_plane]
-        p1 = payload[offset + bytes_per_plane       : offset + 2 * bytes_per_plane]
-        p2 = payload[offset + 2 * bytes_per_plane   : offset + 3 * bytes_per_plane]
-        p3 = payload[offset + 3 * bytes_per_plane   : offset + 4 * bytes_per_plane]
+        idx = 0
+        for k in range(4):
+            plane = payload[offset + k * bytes_per_plane
+                            : offset + (k + 1) * bytes_per_plane]
+            bits = int.from_bytes(b"".join(map(unpack, plane)), "big")
+            idx |= bits << k
         offset += row_stride
+        out += idx.to_bytes(row_len, "big")[:width]
 
-        for x in range(width):
-            bi = x >> 3                       # byte index
-            mask = 0x80 >> (x & 7)            # MSB = leftmost pixel
-
-            color_idx = 0
-            if p0[bi] & mask: color_idx |= 1
-            if p1[bi] & mask: color_idx |= 2
-            if p2[bi] & mask: color_idx |= 4
-            if p3[bi] & mask: color_idx |= 8
-
-            pix[x, y] = surf.map_rgb(VGA[color_idx])
-
-    del pix                                   # unlock surface
-    return surf
+    return out
 
 
 def load_all_sprites(g) -> None:
@@ -3,64 +3,198 @@
 Side convention: 1 = Union, 2 = Confederate (matches UNION/CONFEDERATE constants in cws_globals.py).
 """
 
-import json
 import sqlite3
+import hmac
 import os
-import uuid
-import random
+import queue
+import threading
+import time
+import secrets
 import string
-from datetime import datetime, timezone
+from contextlib import contextmanager
+
+import orjson
 
 
 DB_PATH = os.environ.get("CWS_DB_PATH", "cws_online.db")
 
 
+# Per-connection settings. WAL makes a commit durable once it is in the
+# log, so NORMAL sync skips the per-commit fsync FULL would do; writers
+# wait up to 5 s for the lock instead of failing with SQLITE_BUSY.
+_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+"""
+
+
 def _connect() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+    # Pooled connections are handed between FastAPI's worker threads.
+    # isolation_level=None: no implicit BEGINs, _write() opens its own.
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False,
+                           isolation_level=None)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_PRAGMAS)
     return conn
 
 
+# ── Connection pool ──────────────────────────────────────────────────────
+# Connections stay open for the life of the process instead of being
+# opened (db, -wal and -shm files) and closed on every request. Readers
+# take any idle connection; all writes share one connection under a lock,
+# so writers queue here rather than contending for SQLite's write lock.
+
+_idle_readers: queue.SimpleQueue = queue.SimpleQueue()
+_writer: sqlite3.Connection | None = None
+_writer_lock = threading.Lock()
+
+
+@contextmanager
+def _reader():
+    """Borrow a read connection from the pool (opened on demand)."""
+    try:
+        conn = _idle_readers.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    try:
+        yield conn
+    finally:
+        _idle_readers.put(conn)
+
+
+@contextmanager
+def _write():
+    """Hold the writer connection in a transaction; commit on success.
+
+    BEGIN IMMEDIATE takes SQLite's write lock before the first SELECT, so
+    a read-then-update can never fail to upgrade its lock with BUSY when
+    another process (e.g. a second uvicorn worker) is writing too.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = _connect()
+        _writer.execute("BEGIN IMMEDIATE")
+        try:
+            yield _writer
+        except BaseException:
+            _writer.execute("ROLLBACK")
+            raise
+        _writer.execute("COMMIT")
+
+
+def close_db():
+    """Close every pooled connection (server shutdown)."""
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+            _writer = None
+    while True:
+        try:
+            _idle_readers.get_nowait().close()
+        except queue.Empty:
+            break
+
+
+_SCHEMA_VERSION = 3   # PRAGMA user_version once init_db() has migrated
+
+
 def init_db():
-    """Create the games table if it doesn't exist."""
+    """Create or migrate the schema, then load the token signing key."""
     conn = _connect()
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS games (
-            game_code TEXT PRIMARY KEY,
-            status TEXT DEFAULT 'waiting',
-            union_token TEXT,
-            confed_token TEXT,
-            current_side INTEGER DEFAULT 1,
-            state_json TEXT,
-            turn_number INTEGER DEFAULT 0,
-            phase TEXT DEFAULT 'playing',
-            phase_label TEXT DEFAULT '',
-            created_at TEXT,
-            updated_at TEXT
-        )
-    """)
-    # Migrate existing databases that lack the phase columns
+    # WAL is stored in the database file, so setting it once here is enough
+    conn.execute("PRAGMA journal_mode=WAL")
     try:
-        conn.execute("ALTER TABLE games ADD COLUMN phase TEXT DEFAULT 'playing'")
-    except sqlite3.OperationalError:
-        pass  # column already exists
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            _migrate(conn)
+        _load_token_key(conn)
+    finally:
+        conn.close()
+
+
+def _migrate(conn: sqlite3.Connection):
+    conn.execute("BEGIN IMMEDIATE")
     try:
-        conn.execute("ALTER TABLE games ADD COLUMN phase_label TEXT DEFAULT ''")
-    except sqlite3.OperationalError:
-        pass  # column already exists
-    conn.commit()
-    conn.close()
+        # Another process may have migrated while we waited for the lock
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS games (
+                    game_code TEXT PRIMARY KEY,
+                    status TEXT DEFAULT 'waiting',
+                    union_token TEXT,
+                    confed_token TEXT,
+                    current_side INTEGER DEFAULT 1,
+                    state_json TEXT,
+                    turn_number INTEGER DEFAULT 0,
+                    phase TEXT DEFAULT 'playing',
+                    phase_label TEXT DEFAULT '',
+                    created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
+                    updated_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+                )
+            """)
+            # Databases from before user_version may lack the phase columns
+            cols = {row["name"] for row in conn.execute("PRAGMA table_info(games)")}
+            if "phase" not in cols:
+                conn.execute("ALTER TABLE games ADD COLUMN phase TEXT DEFAULT 'playing'")
+            if "phase_label" not in cols:
+                conn.execute("ALTER TABLE games ADD COLUMN phase_label TEXT DEFAULT ''")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+# ── Tokens ───────────────────────────────────────────────────────────────
+# A player token is "<side>.<HMAC of game code and side>", so checking one
+# needs no database read. The key comes from CWS_TOKEN_SECRET, or else is
+# generated once and kept in the meta table, so tokens survive restarts
+# and every worker process signs with the same key.
+
+_token_key: bytes = b""
+
+
+def _load_token_key(conn: sqlite3.Connection):
+    global _token_key
+    secret = os.environ.get("CWS_TOKEN_SECRET")
+    if not secret:
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('token_secret', ?)",
+                     (secrets.token_hex(32),))
+        secret = conn.execute("SELECT value FROM meta WHERE key='token_secret'").fetchone()["value"]
+    _token_key = secret.encode()
+
+
+def _sign(game_code: str, side: int) -> str:
+    if not _token_key:
+        # An empty key would make every token forgeable
+        raise RuntimeError("token key not loaded; call init_db() first")
+    msg = f"{game_code}.{side}".encode()
+    return hmac.new(_token_key, msg, "sha256").hexdigest()[:32]
+
+
+def _make_token(game_code: str, side: int) -> str:
+    return f"{side}.{_sign(game_code, side)}"
+
+
+_LEGACY_TOKENS_MAX = 1024
+_legacy_tokens: dict = {}  # {(game_code, token): side} for pre-HMAC tokens
+
+
+_CODE_ATTEMPTS = 10   # fresh codes tried before create_game() gives up
+_CODE_CHARS = string.ascii_uppercase + string.digits
 
 
 def _gen_code(length: int = 6) -> str:
-    """Generate a random alphanumeric game code."""
-    chars = string.ascii_uppercase + string.digits
-    return ''.join(random.choices(chars, k=length))
+    """Generate an unguessable alphanumeric game code."""
+    return ''.join([secrets.choice(_CODE_CHARS) for _ in range(length)])
 
 
-def _now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+# UTC timestamp formatted by SQLite itself, inlined into every write
+_NOW = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
 
 
 def create_game(creator_side: int = 1) -> dict:
@@ -69,25 +203,24 @@ def create_game(creator_side: int = 1) -> dict:
     creator_side=1: creator plays Union (token stored as union_token)
     creator_side=2: creator plays Confederate (token stored as confed_token)
     """
-    conn = _connect()
-    game_code = _gen_code()
-    # Ensure uniqueness
-    while conn.execute("SELECT 1 FROM games WHERE game_code=?", (game_code,)).fetchone():
-        game_code = _gen_code()
-    token = str(uuid.uuid4())
-    now = _now()
-    if creator_side == 2:
-        conn.execute(
-            "INSERT INTO games (game_code, confed_token, created_at, updated_at) VALUES (?, ?, ?, ?)",
-            (game_code, token, now, now)
-        )
-    else:
-        conn.execute(
-            "INSERT INTO games (game_code, union_token, created_at, updated_at) VALUES (?, ?, ?, ?)",
-            (game_code, token, now, now)
-        )
-    conn.commit()
-    conn.close()
+    token_col = "confed_token" if creator_side == 2 else "union_token"
+    with _write() as conn:
+        # Codes collide rarely: insert and let the primary key catch it
+        for _ in range(_CODE_ATTEMPTS):
+            game_code = _gen_code()
+            token = _make_token(game_code, creator_side)
+            try:
+                conn.execute(
+                    f"INSERT INTO games (game_code, {token_col}, created_at, updated_at) "
+                    f"VALUES (?, ?, {_NOW}, {_NOW})",
+                    (game_code, token)
+                )
+                break
+            except sqlite3.IntegrityError:
+                continue
+        else:
+            raise RuntimeError("could not find an unused game code")
+    _forget_poll(game_code)
     return {"game_code": game_code, "token": token, "side": creator_side}
 
 
@@ -96,44 +229,38 @@ def join_game(game_code: str) -> dict | None:
 
     Assigns the joiner to whichever side the creator did NOT pick.
     """
-    conn = _connect()
-    row = conn.execute("SELECT * FROM games WHERE game_code=?", (game_code,)).fetchone()
-    if not row:
-        conn.close()
-        return None
-    if row["status"] != "waiting":
-        conn.close()
-        return None
-    # Determine which side is open
-    if row["union_token"] is None and row["confed_token"] is not None:
-        # Creator is Confederate, joiner becomes Union
-        joiner_side = 1
-        token_col = "union_token"
-    elif row["confed_token"] is None and row["union_token"] is not None:
-        # Creator is Union, joiner becomes Confederate
-        joiner_side = 2
-        token_col = "confed_token"
-    else:
-        # Both filled or both empty — shouldn't happen
-        conn.close()
-        return None
-    token = str(uuid.uuid4())
-    now = _now()
-    conn.execute(
-        f"UPDATE games SET {token_col}=?, status='active', updated_at=? WHERE game_code=?",
-        (token, now, game_code)
-    )
-    conn.commit()
-    conn.close()
+    with _write() as conn:
+        row = conn.execute("SELECT status, union_token, confed_token FROM games WHERE game_code=?",
+                           (game_code,)).fetchone()
+        if not row:
+            return None
+        if row["status"] != "waiting":
+            return None
+        # Determine which side is open
+        if row["union_token"] is None and row["confed_token"] is not None:
+            # Creator is Confederate, joiner becomes Union
+            joiner_side = 1
+            token_col = "union_token"
+        elif row["confed_token"] is None and row["union_token"] is not None:
+            # Creator is Union, joiner becomes Confederate
+            joiner_side = 2
+            token_col = "confed_token"
+        else:
+            # Both filled or both empty — shouldn't happen
+            return None
+        token = _make_token(game_code, joiner_side)
+        conn.execute(
+            f"UPDATE games SET {token_col}=?, status='active', updated_at={_NOW} WHERE game_code=?",
+            (token, game_code)
+        )
+    _forget_poll(game_code)
     return {"token": token, "side": joiner_side}
 
 
 def get_game_status(game_code: str) -> dict | None:
     """Get game status. Returns {status, current_side, turn_number} or None."""
-    conn = _connect()
-    row = conn.execute("SELECT status, current_side, turn_number FROM games WHERE game_code=?",
-                       (game_code,)).fetchone()
-    conn.close()
+    # Same columns the pollers read, so share their cached row
+    row = _poll_row(game_code)
     if not row:
         return None
     return {"status": row["status"], "current_side": row["current_side"],
@@ -142,90 +269,142 @@ def get_game_status(game_code: str) -> dict | None:
 
 def authenticate(game_code: str, token: str) -> int | None:
     """Verify token and return the player's side (1 or 2), or None."""
-    conn = _connect()
-    row = conn.execute("SELECT union_token, confed_token FROM games WHERE game_code=?",
-                       (game_code,)).fetchone()
-    conn.close()
+    side, _, sig = token.partition(".")
+    if side in ("1", "2") and sig:
+        if hmac.compare_digest(sig.encode(), _sign(game_code, int(side)).encode()):
+            return int(side)
+        return None
+    # Random UUID tokens issued before signed tokens are still in the table.
+    # A token is never reassigned once issued, so a match can be kept.
+    side = _legacy_tokens.get((game_code, token))
+    if side is not None:
+        return side
+    with _reader() as conn:
+        row = conn.execute("SELECT union_token, confed_token FROM games WHERE game_code=?",
+                           (game_code,)).fetchone()
     if not row:
         return None
     if row["union_token"] == token:
-        return 1
-    if row["confed_token"] == token:
-        return 2
-    return None
+        side = 1
+    elif row["confed_token"] == token:
+        side = 2
+    else:
+        return None
+    if len(_legacy_tokens) >= _LEGACY_TOKENS_MAX:
+        _legacy_tokens.clear()
+    _legacy_tokens[(game_code, token)] = side
+    return side
 
 
 def submit_turn(game_code: str, side: int, turn_number: int, state: dict) -> bool:
     """Submit a completed turn. Returns True on success."""
-    conn = _connect()
-    row = conn.execute("SELECT current_side, turn_number FROM games WHERE game_code=?",
-                       (game_code,)).fetchone()
-    if not row:
-        conn.close()
-        return False
-    if row["current_side"] != side:
-        conn.close()
-        return False
-    if row["turn_number"] != turn_number:
-        conn.close()
-        return False
     new_side = 2 if side == 1 else 1
-    now = _now()
-    conn.execute(
-        "UPDATE games SET state_json=?, current_side=?, turn_number=?, phase='playing', phase_label='', updated_at=? WHERE game_code=?",
-        (json.dumps(state), new_side, turn_number + 1, now, game_code)
-    )
-    conn.commit()
-    conn.close()
-    return True
+    state_json = orjson.dumps(state).decode()
+    with _write() as conn:
+        # Only matches if it is this side's turn at this turn number
+        cur = conn.execute(
+            "UPDATE games SET state_json=?, current_side=?, turn_number=?, phase='playing', phase_label='', "
+            f"updated_at={_NOW} "
+            "WHERE game_code=? AND current_side=? AND turn_number=?",
+            (state_json, new_side, turn_number + 1, game_code, side, turn_number)
+        )
+    _forget_poll(game_code)
+    return cur.rowcount == 1
+
+
+# ── Poll coalescing ──────────────────────────────────────────────────────
+# Both clients poll their game about once a second. Each game's row is
+# kept for _POLL_TTL seconds, and concurrent polls of the same game wait
+# for one SELECT instead of each running their own. Writers in this
+# process drop the entry as soon as they commit; a write from another
+# worker process shows up once the entry expires.
+
+_POLL_TTL = 0.2
+_POLL_ROWS_MAX = 256
+_POLL_LOCKS = 64          # fetch locks, shared between games by hash
+
+_poll_rows: dict = {}      # {game_code: (fetched_at, row)}, oldest first
+_poll_fetching: dict = {}  # {game_code: True once a write lands mid-fetch}
+_poll_locks = [threading.Lock() for _ in range(_POLL_LOCKS)]
+_poll_lock = threading.Lock()
+
+
+def _forget_poll(game_code: str) -> None:
+    """Drop a game's cached poll row after a write has committed."""
+    with _poll_lock:
+        _poll_rows.pop(game_code, None)
+        if game_code in _poll_fetching:
+            _poll_fetching[game_code] = True
+
+
+def _poll_row(game_code: str):
+    """Return the game's poll columns, shared between concurrent pollers."""
+    hit = _poll_rows.get(game_code)
+    if hit is not None and time.monotonic() - hit[0] < _POLL_TTL:
+        return hit[1]
+    with _poll_locks[hash(game_code) % _POLL_LOCKS]:
+        # Another poller may have fetched it while we waited
+        hit = _poll_rows.get(game_code)
+        if hit is not None and time.monotonic() - hit[0] < _POLL_TTL:
+            return hit[1]
+        with _poll_lock:
+            _poll_fetching[game_code] = False
+        fetched_at = time.monotonic()
+        with _reader() as conn:
+            row = conn.execute("SELECT current_side, turn_number, state_json, status, phase, phase_label FROM games WHERE game_code=?",
+                               (game_code,)).fetchone()
+        with _poll_lock:
+            # Keep it only if the game exists (GET /api/games/{code} needs
+            # no token, so made-up codes must not fill the cache) and no
+            # write landed while we were reading
+            if not _poll_fetching.pop(game_code) and row is not None:
+                _poll_rows.pop(game_code, None)
+                while len(_poll_rows) >= _POLL_ROWS_MAX:
+                    del _poll_rows[next(iter(_poll_rows))]
+                _poll_rows[game_code] = (fetched_at, row)
+    return row
 
 
 def poll_turn(game_code: str, side: int) -> dict:
-    """Poll for opponent's turn. Returns {ready, state, turn_number, phase, phase_label}."""
-    conn = _connect()
-    row = conn.execute("SELECT current_side, turn_number, state_json, status, phase, phase_label FROM games WHERE game_code=?",
-                       (game_code,)).fetchone()
-    conn.close()
+    """Poll for opponent's turn.
+
+    Returns {ready, state_json, turn_number, phase, phase_label}, where
+    state_json is the stored state as submit_turn() serialized it (or
+    None), so pollers can pass it through without decoding it.
+    """
+    row = _poll_row(game_code)
     if not row:
-        return {"ready": False, "state": None, "turn_number": 0,
+        return {"ready": False, "state_json": None, "turn_number": 0,
                 "phase": "playing", "phase_label": ""}
     phase = row["phase"] or "playing"
     phase_label = row["phase_label"] or ""
     if row["status"] == "finished":
-        state = json.loads(row["state_json"]) if row["state_json"] else None
-        return {"ready": True, "state": state, "turn_number": row["turn_number"],
+        return {"ready": True, "state_json": row["state_json"] or None,
+                "turn_number": row["turn_number"],
                 "phase": phase, "phase_label": phase_label}
     if row["current_side"] == side and row["state_json"]:
-        state = json.loads(row["state_json"])
-        return {"ready": True, "state": state, "turn_number": row["turn_number"],
+        return {"ready": True, "state_json": row["state_json"],
+                "turn_number": row["turn_number"],
                 "phase": phase, "phase_label": phase_label}
-    return {"ready": False, "state": None, "turn_number": row["turn_number"],
+    return {"ready": False, "state_json": None, "turn_number": row["turn_number"],
             "phase": phase, "phase_label": phase_label}
 
 
 def set_phase(game_code: str, side: int, phase: str, label: str = "") -> bool:
     """Set the current phase of a game (e.g. 'events' during monthly processing)."""
-    conn = _connect()
-    row = conn.execute("SELECT current_side FROM games WHERE game_code=?", (game_code,)).fetchone()
-    if not row:
-        conn.close()
-        return False
-    now = _now()
-    conn.execute(
-        "UPDATE games SET phase=?, phase_label=?, updated_at=? WHERE game_code=?",
-        (phase, label, now, game_code)
-    )
-    conn.commit()
-    conn.close()
-    return True
+    with _write() as conn:
+        cur = conn.execute(
+            f"UPDATE games SET phase=?, phase_label=?, updated_at={_NOW} WHERE game_code=?",
+            (phase, label, game_code)
+        )
+    _forget_poll(game_code)
+    return cur.rowcount == 1
 
 
 def finish_game(game_code: str) -> bool:
     """Mark a game as finished."""
-    conn = _connect()
-    now = _now()
-    conn.execute("UPDATE games SET status='finished', updated_at=? WHERE game_code=?",
-                 (now, game_code))
-    conn.commit()
-    conn.close()
+    with _write() as conn:
+        conn.execute(f"UPDATE games SET status='finished', updated_at={_NOW} WHERE game_code=?",
+                     (game_code,))
+    _forget_poll(game_code)
     return True
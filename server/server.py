@@ -2,11 +2,14 @@
 
 Run:
     cd server
-    pip install fastapi uvicorn
+    pip install -r requirements.txt
     uvicorn server:app --host 0.0.0.0 --port 1861
 """
 
-from fastapi import FastAPI, HTTPException, Header
+import asyncio
+import anyio
+import orjson
+from fastapi import FastAPI, HTTPException, Header, Query, Response
 from typing import Optional
 
 import database as db
@@ -17,12 +20,43 @@ from models import (
 
 app = FastAPI(title="CWS Online Server")
 
+# Long-poll: the longest a GET .../turn?wait=N may be held open
+LONG_POLL_MAX = 25.0
+
+# Threads for blocking database calls. Endpoints are async and hand
+# their SQLite work to this pool, sized apart from the 40-thread default
+# so a burst of polls isn't capped by it.
+DB_THREADS = 200
+_db_limiter: Optional[anyio.CapacityLimiter] = None
+
+# {game_code: Event set on that game's next turn or phase change}
+_turn_changed: dict[str, asyncio.Event] = {}
+
+
+async def _db(func, *args):
+    """Run a blocking database call on the DB thread pool."""
+    return await anyio.to_thread.run_sync(func, *args, limiter=_db_limiter)
+
+
+def _notify(game_code: str) -> None:
+    """Wake long-polls waiting on this game."""
+    event = _turn_changed.pop(game_code, None)
+    if event is not None:
+        event.set()
+
 
 @app.on_event("startup")
-def startup():
+async def startup():
+    global _db_limiter
+    _db_limiter = anyio.CapacityLimiter(DB_THREADS)
     db.init_db()
 
 
+@app.on_event("shutdown")
+def shutdown():
+    db.close_db()
+
+
 def _auth(game_code: str, authorization: Optional[str]) -> int:
     """Extract token from Authorization header and authenticate."""
     if not authorization or not authorization.startswith("Bearer "):
@@ -35,55 +69,87 @@ def _auth(game_code: str, authorization: Optional[str]) -> int:
 
 
 @app.post("/api/games", response_model=CreateGameResponse)
-def create_game(body: CreateGameRequest = CreateGameRequest()):
+async def create_game(body: CreateGameRequest = CreateGameRequest()):
     """Create a new game. Returns game code and token for chosen side."""
-    result = db.create_game(creator_side=body.side)
+    result = await _db(db.create_game, body.side)
     return CreateGameResponse(**result)
 
 
 @app.post("/api/games/{code}/join", response_model=JoinResponse)
-def join_game(code: str):
+async def join_game(code: str):
     """Join an existing game as Confederate."""
-    result = db.join_game(code)
+    result = await _db(db.join_game, code)
     if result is None:
         raise HTTPException(status_code=404, detail="Game not found or already full")
     return JoinResponse(**result)
 
 
 @app.get("/api/games/{code}", response_model=GameStatusResponse)
-def game_status(code: str):
+async def game_status(code: str):
     """Get game status (no auth required)."""
-    result = db.get_game_status(code)
+    result = await _db(db.get_game_status, code)
     if result is None:
         raise HTTPException(status_code=404, detail="Game not found")
     return GameStatusResponse(**result)
 
 
 @app.post("/api/games/{code}/turn")
-def submit_turn(code: str, body: TurnSubmitRequest,
-                authorization: Optional[str] = Header(None)):
+async def submit_turn(code: str, body: TurnSubmitRequest,
+                      authorization: Optional[str] = Header(None)):
     """Upload a completed turn."""
-    side = _auth(code, authorization)
-    ok = db.submit_turn(code, side, body.turn_number, body.state)
+    side = await _db(_auth, code, authorization)
+    ok = await _db(db.submit_turn, code, side, body.turn_number, body.state)
     if not ok:
         raise HTTPException(status_code=409, detail="Not your turn or wrong turn number")
+    _notify(code)
     return {"ok": True}
 
 
 @app.post("/api/games/{code}/phase")
-def set_game_phase(code: str, body: PhaseRequest,
-                   authorization: Optional[str] = Header(None)):
+async def set_game_phase(code: str, body: PhaseRequest,
+                         authorization: Optional[str] = Header(None)):
     """Signal a phase change (e.g. 'events' when monthly processing starts)."""
-    side = _auth(code, authorization)
-    ok = db.set_phase(code, side, body.phase, body.label)
+    side = await _db(_auth, code, authorization)
+    ok = await _db(db.set_phase, code, side, body.phase, body.label)
     if not ok:
         raise HTTPException(status_code=404, detail="Game not found")
+    _notify(code)
     return {"ok": True}
 
 
+def _poll_body(result: dict) -> str:
+    """Serialize a db.poll_turn() result in TurnPollResponse's layout.
+
+    The state is spliced in as stored: it is already JSON, and decoding
+    it only to encode it again would cost O(state size) on every poll.
+    """
+    return '{"ready":%s,"state":%s,"turn_number":%d,"phase":%s,"phase_label":%s}' % (
+        "true" if result["ready"] else "false",
+        result["state_json"] or "null",
+        result["turn_number"],
+        orjson.dumps(result["phase"]).decode(),
+        orjson.dumps(result["phase_label"]).decode(),
+    )
+
+
 @app.get("/api/games/{code}/turn", response_model=TurnPollResponse)
-def poll_turn(code: str, authorization: Optional[str] = Header(None)):
-    """Poll for opponent's completed turn."""
-    side = _auth(code, authorization)
-    result = db.poll_turn(code, side)
-    return TurnPollResponse(**result)
+async def poll_turn(code: str, authorization: Optional[str] = Header(None),
+                    wait: float = Query(0, ge=0, le=LONG_POLL_MAX)):
+    """Poll for opponent's completed turn.
+
+    With ?wait=N, a not-ready poll is held open for up to N seconds and
+    answered as soon as the game's turn or phase changes, so a waiting
+    client needs one request per change instead of one per poll interval.
+    """
+    side = await _db(_auth, code, authorization)
+    # Subscribe before reading so a change in between still wakes us
+    event = _turn_changed.setdefault(code, asyncio.Event()) if wait else None
+    result = await _db(db.poll_turn, code, side)
+    if event is not None and not result["ready"]:
+        try:
+            await asyncio.wait_for(event.wait(), timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            result = await _db(db.poll_turn, code, side)
+    return Response(_poll_body(result), media_type="application/json")